@@ -718,6 +718,20 @@ def add_ai_message_chunks(
     )
 
 
+_TOKEN_COUNT_KEYS = frozenset(("input_tokens", "output_tokens", "total_tokens"))
+"""Keys of a `UsageMetadata` that carries only the required token counts."""
+
+
+def _is_plain_token_counts(usage: UsageMetadata) -> bool:
+    # Only int counts may skip `_dict_int_op`, which validates value types.
+    return (
+        usage.keys() == _TOKEN_COUNT_KEYS
+        and type(usage["input_tokens"]) is int
+        and type(usage["output_tokens"]) is int
+        and type(usage["total_tokens"]) is int
+    )
+
+
 def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageMetadata:
     """Recursively add two UsageMetadata objects.
 
@@ -765,15 +779,16 @@ def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageM
     if not (left and right):
         return cast("UsageMetadata", left or right)
 
-    return UsageMetadata(
-        **cast(
-            "UsageMetadata",
-            _dict_int_op(
-                cast("dict", left),
-                cast("dict", right),
-                operator.add,
-            ),
+    if _is_plain_token_counts(left) and _is_plain_token_counts(right):
+        # Plain token counts without details, the common case when streaming.
+        return UsageMetadata(
+            input_tokens=left["input_tokens"] + right["input_tokens"],
+            output_tokens=left["output_tokens"] + right["output_tokens"],
+            total_tokens=left["total_tokens"] + right["total_tokens"],
         )
+    return cast(
+        "UsageMetadata",
+        _dict_int_op(cast("dict", left), cast("dict", right), operator.add),
     )
 
 
@@ -828,13 +843,17 @@ def subtract_usage(
     if not (left and right):
         return cast("UsageMetadata", left or right)
 
-    return UsageMetadata(
-        **cast(
-            "UsageMetadata",
-            _dict_int_op(
-                cast("dict", left),
-                cast("dict", right),
-                (lambda le, ri: max(le - ri, 0)),
-            ),
+    if _is_plain_token_counts(left) and _is_plain_token_counts(right):
+        return UsageMetadata(
+            input_tokens=max(left["input_tokens"] - right["input_tokens"], 0),
+            output_tokens=max(left["output_tokens"] - right["output_tokens"], 0),
+            total_tokens=max(left["total_tokens"] - right["total_tokens"], 0),
         )
+    return cast(
+        "UsageMetadata",
+        _dict_int_op(
+            cast("dict", left),
+            cast("dict", right),
+            (lambda le, ri: max(le - ri, 0)),
+        ),
     )
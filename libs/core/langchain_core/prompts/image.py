@@ -11,7 +11,8 @@ from langchain_core.prompts.string import (
     PromptTemplateFormat,
     get_template_variables,
 )
-from langchain_core.runnables import run_in_executor
+
+_RESERVED_VARIABLES = frozenset(("url", "path", "detail"))
 
 
 class ImagePromptTemplate(BasePromptTemplate[ImageURL]):
@@ -45,17 +46,16 @@ class ImagePromptTemplate(BasePromptTemplate[ImageURL]):
             ValueError: If the input variables contain `'url'`, `'path'`, or
                 `'detail'`.
         """
-        if "input_variables" not in kwargs:
-            kwargs["input_variables"] = []
-
-        overlap = set(kwargs["input_variables"]) & {"url", "path", "detail"}
-        if overlap:
-            msg = (
-                "input_variables for the image template cannot contain"
-                " any of 'url', 'path', or 'detail'."
-                f" Found: {overlap}"
-            )
-            raise ValueError(msg)
+        input_variables = kwargs.setdefault("input_variables", [])
+        if input_variables:
+            overlap = _RESERVED_VARIABLES.intersection(input_variables)
+            if overlap:
+                msg = (
+                    "input_variables for the image template cannot contain"
+                    " any of 'url', 'path', or 'detail'."
+                    f" Found: {set(overlap)}"
+                )
+                raise ValueError(msg)
 
         template = kwargs.get("template", {})
         template_format = kwargs.get("template_format", "f-string")
@@ -124,11 +124,14 @@ class ImagePromptTemplate(BasePromptTemplate[ImageURL]):
             ```
         """
         formatted = {}
+        formatter = DEFAULT_FORMATTER_MAPPING[self.template_format]
+        always_format = self.template_format == "jinja2"
         for k, v in self.template.items():
-            if isinstance(v, str):
-                formatted[k] = DEFAULT_FORMATTER_MAPPING[self.template_format](
-                    v, **kwargs
-                )
+            # Values without braces format to themselves, so skip the formatter
+            # for them. Jinja2 rendering can still alter brace-free text (e.g.
+            # trailing newlines), so every jinja2 string is formatted.
+            if isinstance(v, str) and (always_format or "{" in v or "}" in v):
+                formatted[k] = formatter(v, **kwargs)
             else:
                 formatted[k] = v
         url = kwargs.get("url") or formatted.get("url")
@@ -160,7 +163,9 @@ class ImagePromptTemplate(BasePromptTemplate[ImageURL]):
         Returns:
             A formatted string.
         """
-        return await run_in_executor(None, self.format, **kwargs)
+        # Formatting never touches the filesystem (loading from 'path' was
+        # removed), so there is no blocking I/O to offload to an executor.
+        return self.format(**kwargs)
 
     def pretty_repr(
         self,
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import json
 import random
 import re
 import string
+import threading
 import time
 import urllib.parse
-from dataclasses import asdict
+import zlib
+from collections import OrderedDict
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -41,6 +46,34 @@ except ImportError:
 
 MARKDOWN_SPECIAL_CHARS = "*_`"
 
+_HEX_COLOR_PATTERN = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
+
+# Recently rendered Mermaid.INK images, keyed by request URL. The URL encodes the
+# graph syntax, image type, background color and server, so identical renders
+# can skip the HTTP round-trip.
+_API_IMAGE_CACHE: OrderedDict[str, bytes] = OrderedDict()
+_API_IMAGE_CACHE_MAXSIZE = 16
+_API_IMAGE_CACHE_LOCK = threading.Lock()
+
+_SAFE_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+class _SafeIdTable(dict[int, str]):
+    """`str.translate` table mapping codepoints to their Mermaid-safe form.
+
+    Entries are filled in on first lookup, so the table only ever holds the
+    characters that actually appear in node ids.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        safe = char if char in _SAFE_ID_CHARS else "\\" + format(codepoint, "x")
+        self[codepoint] = safe
+        return safe
+
+
+_SAFE_ID_TABLE = _SafeIdTable()
+
 
 def draw_mermaid(
     nodes: dict[str, Node],
@@ -100,14 +133,15 @@ def draw_mermaid(
         },
     }
 
-    mermaid_graph = (
-        (
-            "---\n"
-            + yaml.dump(frontmatter_config, default_flow_style=False)
-            + "---\ngraph TD;\n"
-        )
+    # Collect the output fragments and join them once at the end
+    parts: list[str] = (
+        [
+            "---\n",
+            yaml.dump(frontmatter_config, default_flow_style=False),
+            "---\ngraph TD;\n",
+        ]
         if with_styles
-        else "graph TD;\n"
+        else ["graph TD;\n"]
     )
     # Group nodes by subgraph
     subgraph_nodes: dict[str, dict[str, Node]] = {}
@@ -121,14 +155,6 @@ def draw_mermaid(
         else:
             regular_nodes[key] = node
 
-    # Node formatting templates
-    default_class_label = "default"
-    format_dict = {default_class_label: "{0}({1})"}
-    if first_node is not None:
-        format_dict[first_node] = "{0}([{1}]):::first"
-    if last_node is not None:
-        format_dict[last_node] = "{0}([{1}]):::last"
-
     def render_node(key: str, node: Node, indent: str = "\t") -> str:
         """Helper function to render a node with consistent formatting."""
         node_name = node.name.split(":")[-1]
@@ -144,15 +170,18 @@ def draw_mermaid(
                 + "\n".join(f"{k} = {value}" for k, value in node.metadata.items())
                 + "</em></small>"
             )
-        node_label = format_dict.get(key, format_dict[default_class_label]).format(
-            _to_safe_id(key), label
-        )
-        return f"{indent}{node_label}\n"
+        safe_id = _to_safe_id(key)
+        # The last-node style wins when a node is both first and last
+        if key == last_node:
+            return f"{indent}{safe_id}([{label}]):::last\n"
+        if key == first_node:
+            return f"{indent}{safe_id}([{label}]):::first\n"
+        return f"{indent}{safe_id}({label})\n"
 
     # Add non-subgraph nodes to the graph
     if with_styles:
         for key, node in regular_nodes.items():
-            mermaid_graph += render_node(key, node)
+            parts.append(render_node(key, node))
 
     # Group edges by their common prefixes
     edge_groups: dict[str, list[Edge]] = {}
@@ -167,7 +196,6 @@ def draw_mermaid(
     seen_subgraphs = set()
 
     def add_subgraph(edges: list[Edge], prefix: str) -> None:
-        nonlocal mermaid_graph
         self_loop = len(edges) == 1 and edges[0].source == edges[0].target
         if prefix and not self_loop:
             subgraph = prefix.rsplit(":", maxsplit=1)[-1]
@@ -180,36 +208,37 @@ def draw_mermaid(
                 raise ValueError(msg)
 
             seen_subgraphs.add(subgraph)
-            mermaid_graph += f"\tsubgraph {subgraph}\n"
+            parts.append(f"\tsubgraph {subgraph}\n")
 
             # Add nodes that belong to this subgraph
             if with_styles and prefix in subgraph_nodes:
                 for key, node in subgraph_nodes[prefix].items():
-                    mermaid_graph += render_node(key, node)
-
-        for edge in edges:
-            source, target = edge.source, edge.target
+                    parts.append(render_node(key, node))
 
+        # Edge is a NamedTuple, so unpacking binds all fields without attribute
+        # lookups
+        for source, target, data, conditional in edges:
             # Add BR every wrap_label_n_words words
-            if edge.data is not None:
-                edge_data = edge.data
-                words = str(edge_data).split()  # Split the string into words
-                # Group words into chunks of wrap_label_n_words size
-                if len(words) > wrap_label_n_words:
-                    edge_data = "&nbsp<br>&nbsp".join(
-                        " ".join(words[i : i + wrap_label_n_words])
-                        for i in range(0, len(words), wrap_label_n_words)
-                    )
-                if edge.conditional:
+            if data is not None:
+                edge_data = str(data)
+                # More than n words need at least 2n + 1 characters, so shorter
+                # labels can skip splitting altogether
+                if len(edge_data) > 2 * wrap_label_n_words:
+                    words = edge_data.split()  # Split the string into words
+                    # Group words into chunks of wrap_label_n_words size
+                    if len(words) > wrap_label_n_words:
+                        edge_data = "&nbsp<br>&nbsp".join(
+                            " ".join(words[i : i + wrap_label_n_words])
+                            for i in range(0, len(words), wrap_label_n_words)
+                        )
+                if conditional:
                     edge_label = f" -. &nbsp;{edge_data}&nbsp; .-> "
                 else:
                     edge_label = f" -- &nbsp;{edge_data}&nbsp; --> "
             else:
-                edge_label = " -.-> " if edge.conditional else " --> "
+                edge_label = " -.-> " if conditional else " --> "
 
-            mermaid_graph += (
-                f"\t{_to_safe_id(source)}{edge_label}{_to_safe_id(target)};\n"
-            )
+            parts.append(f"\t{_to_safe_id(source)}{edge_label}{_to_safe_id(target)};\n")
 
         # Recursively add nested subgraphs
         for nested_prefix, edges_ in edge_groups.items():
@@ -221,7 +250,7 @@ def draw_mermaid(
             add_subgraph(edges_, nested_prefix)
 
         if prefix and not self_loop:
-            mermaid_graph += "\tend\n"
+            parts.append("\tend\n")
 
     # Start with the top-level edges (no common prefix)
     add_subgraph(edge_groups.get("", []), "")
@@ -237,21 +266,26 @@ def draw_mermaid(
     if with_styles:
         for prefix, subgraph_node in subgraph_nodes.items():
             if ":" not in prefix and prefix not in seen_subgraphs:
-                mermaid_graph += f"\tsubgraph {prefix}\n"
+                parts.append(f"\tsubgraph {prefix}\n")
 
                 # Add nodes that belong to this subgraph
                 for key, node in subgraph_node.items():
-                    mermaid_graph += render_node(key, node)
+                    parts.append(render_node(key, node))
 
-                mermaid_graph += "\tend\n"
+                parts.append("\tend\n")
                 seen_subgraphs.add(prefix)
 
     # Add custom styles for nodes
     if with_styles:
-        mermaid_graph += _generate_mermaid_graph_styles(node_styles or NodeStyles())
-    return mermaid_graph
+        parts.append(
+            _generate_mermaid_graph_styles(node_styles)
+            if node_styles is not None
+            else _default_mermaid_graph_styles()
+        )
+    return "".join(parts)
 
 
+@lru_cache(maxsize=1024)
 def _to_safe_id(label: str) -> str:
     """Convert a string into a Mermaid-compatible node id.
 
@@ -261,17 +295,24 @@ def _to_safe_id(label: str) -> str:
     Result is guaranteed to be unique and Mermaid-compatible,
     so nodes with special characters always render correctly.
     """
-    allowed = string.ascii_letters + string.digits + "_-"
-    out = [ch if ch in allowed else "\\" + format(ord(ch), "x") for ch in label]
-    return "".join(out)
+    # Most node ids are already safe; a set check is cheaper than translating
+    if _SAFE_ID_CHARS.issuperset(label):
+        return label
+    return label.translate(_SAFE_ID_TABLE)
 
 
 def _generate_mermaid_graph_styles(node_colors: NodeStyles) -> str:
     """Generates Mermaid graph styles for different node types."""
-    styles = ""
-    for class_name, style in asdict(node_colors).items():
-        styles += f"\tclassDef {class_name} {style}\n"
-    return styles
+    return "".join(
+        f"\tclassDef {field.name} {getattr(node_colors, field.name)}\n"
+        for field in fields(node_colors)
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_mermaid_graph_styles() -> str:
+    """Mermaid graph styles for the default `NodeStyles`, built once."""
+    return _generate_mermaid_graph_styles(NodeStyles())
 
 
 def draw_mermaid_png(
@@ -402,6 +443,13 @@ async def _render_mermaid_using_pyppeteer(
     return img_bytes
 
 
+def _encode_mermaid_pako(mermaid_syntax: str) -> str:
+    """Encode Mermaid syntax in the Mermaid Live Editor "pako" format."""
+    state = json.dumps({"code": mermaid_syntax, "mermaid": '{"theme": "default"}'})
+    compressed = zlib.compress(state.encode("utf8"), level=9)
+    return "pako:" + base64.urlsafe_b64encode(compressed).decode("ascii").rstrip("=")
+
+
 def _render_mermaid_using_api(
     mermaid_syntax: str,
     *,
@@ -429,16 +477,19 @@ def _render_mermaid_using_api(
         )
         raise ImportError(msg)
 
-    # Use Mermaid API to render the image
+    # Use Mermaid API to render the image. Large graphs can exceed the URL length
+    # the server accepts, so also build the zlib-compressed "pako" form used by the
+    # Mermaid Live Editor and send whichever is shorter.
     mermaid_syntax_encoded = base64.b64encode(mermaid_syntax.encode("utf8")).decode(
         "ascii"
     )
+    pako_encoded = _encode_mermaid_pako(mermaid_syntax)
+    if len(pako_encoded) < len(mermaid_syntax_encoded):
+        mermaid_syntax_encoded = pako_encoded
 
     # Check if the background color is a hexadecimal color code using regex
-    if background_color is not None:
-        hex_color_pattern = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
-        if not hex_color_pattern.match(background_color):
-            background_color = f"!{background_color}"
+    if background_color is not None and not _HEX_COLOR_PATTERN.match(background_color):
+        background_color = f"!{background_color}"
 
     # URL-encode the background_color to handle special characters like '!'
     encoded_bg_color = urllib.parse.quote(str(background_color), safe="")
@@ -447,6 +498,15 @@ def _render_mermaid_using_api(
         f"?type={file_type}&bgColor={encoded_bg_color}"
     )
 
+    with _API_IMAGE_CACHE_LOCK:
+        cached_bytes = _API_IMAGE_CACHE.get(image_url)
+        if cached_bytes is not None:
+            _API_IMAGE_CACHE.move_to_end(image_url)
+    if cached_bytes is not None:
+        if output_file_path is not None:
+            Path(output_file_path).write_bytes(cached_bytes)
+        return cached_bytes
+
     error_msg_suffix = (
         "To resolve this issue:\n"
         "1. Check your internet connection and try again\n"
@@ -461,8 +521,12 @@ def _render_mermaid_using_api(
             response = requests.get(image_url, timeout=10, proxies=proxies)
             if response.status_code == requests.codes.ok:
                 img_bytes = response.content
+                with _API_IMAGE_CACHE_LOCK:
+                    _API_IMAGE_CACHE[image_url] = img_bytes
+                    if len(_API_IMAGE_CACHE) > _API_IMAGE_CACHE_MAXSIZE:
+                        _API_IMAGE_CACHE.popitem(last=False)
                 if output_file_path is not None:
-                    Path(output_file_path).write_bytes(response.content)
+                    Path(output_file_path).write_bytes(img_bytes)
 
                 return img_bytes
 
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import contextlib
 import functools
 import inspect
 import json
 import logging
 import typing
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable  # noqa: TC003
 from inspect import signature
@@ -1353,6 +1355,11 @@ def _get_type_hints(func: Callable) -> dict[str, type] | None:
         return None
 
 
+_RUNNABLE_CONFIG_PARAMS: weakref.WeakKeyDictionary[Callable, str | None] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def _get_runnable_config_param(func: Callable) -> str | None:
     """Find the parameter name for `RunnableConfig` in a function.
 
@@ -1362,13 +1369,25 @@ def _get_runnable_config_param(func: Callable) -> str | None:
     Returns:
         The parameter name for `RunnableConfig`, or `None` if not found.
     """
+    # Bound methods share their function's hints; key on the function so lookups
+    # hit across instances without keeping the instances alive.
+    func = getattr(func, "__func__", func)
+    try:
+        return _RUNNABLE_CONFIG_PARAMS[func]
+    except (KeyError, TypeError):
+        pass
     type_hints = _get_type_hints(func)
-    if not type_hints:
+    if type_hints is None:
+        # Hints may become resolvable later (e.g. forward references), so only
+        # successful lookups are cached.
         return None
-    for name, type_ in type_hints.items():
-        if type_ is RunnableConfig:
-            return name
-    return None
+    config_param = next(
+        (name for name, type_ in type_hints.items() if type_ is RunnableConfig), None
+    )
+    # Callables that are unhashable or not weak-referenceable are not cached
+    with contextlib.suppress(TypeError):
+        _RUNNABLE_CONFIG_PARAMS[func] = config_param
+    return config_param
 
 
 class InjectedToolArg:
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import contextlib
 import functools
 import textwrap
+import weakref
 from collections.abc import Awaitable, Callable
 from inspect import signature
 from typing import (
@@ -90,7 +92,7 @@ class StructuredTool(BaseTool):
             The result of the tool execution
         """
         if self.func:
-            if run_manager and signature(self.func).parameters.get("callbacks"):
+            if run_manager and _accepts_callbacks(self.func):
                 kwargs["callbacks"] = run_manager.get_child()
             if config_param := _get_runnable_config_param(self.func):
                 kwargs[config_param] = config
@@ -117,7 +119,7 @@ class StructuredTool(BaseTool):
             The result of the tool execution
         """
         if self.coroutine:
-            if run_manager and signature(self.coroutine).parameters.get("callbacks"):
+            if run_manager and _accepts_callbacks(self.coroutine):
                 kwargs["callbacks"] = run_manager.get_child()
             if config_param := _get_runnable_config_param(self.coroutine):
                 kwargs[config_param] = config
@@ -264,8 +266,35 @@ class StructuredTool(BaseTool):
 
 
 def _filter_schema_args(func: Callable) -> list[str]:
-    filter_args = list(FILTERED_ARGS)
     if config_param := _get_runnable_config_param(func):
-        filter_args.append(config_param)
+        return [*FILTERED_ARGS, config_param]
     # filter_args.extend(_get_non_model_params(type_hints))
-    return filter_args
+    return list(FILTERED_ARGS)
+
+
+_ACCEPTS_CALLBACKS: weakref.WeakKeyDictionary[Callable, bool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _accepts_callbacks(func: Callable) -> bool:
+    """Check whether a tool function takes a `callbacks` argument.
+
+    Args:
+        func: The function to inspect.
+
+    Returns:
+        Whether the function has a `callbacks` parameter.
+    """
+    # Cached per function like `_get_runnable_config_param`, so reassigning a
+    # tool's function never reuses the answer for the old one.
+    func = getattr(func, "__func__", func)
+    try:
+        return _ACCEPTS_CALLBACKS[func]
+    except (KeyError, TypeError):
+        pass
+    accepts_callbacks = "callbacks" in signature(func).parameters
+    # Callables that are unhashable or not weak-referenceable are not cached
+    with contextlib.suppress(TypeError):
+        _ACCEPTS_CALLBACKS[func] = accepts_callbacks
+    return accepts_callbacks
@@ -73,6 +73,9 @@ class RunInfo(TypedDict):
     run_type: str
     """The type of the run."""
 
+    str_run_id: str
+    """The ID of the run cast to a string, as it appears in emitted events."""
+
     inputs: NotRequired[Any]
     """The inputs to the run."""
 
@@ -82,6 +85,9 @@ class RunInfo(TypedDict):
     tool_call_id: NotRequired[str | None]
     """The tool call ID associated with the run."""
 
+    stream_event: NotRequired[StandardStreamEvent]
+    """Template for the model stream events of the run, built on the first token."""
+
 
 def _assign_name(name: str | None, serialized: dict[str, Any] | None) -> str:
     """Assign a name to a run."""
@@ -136,9 +142,21 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             exclude_types=exclude_types,
             exclude_tags=exclude_tags,
         )
+        # Without any filters every event is sent, so skip evaluating the filter.
+        self._filter_is_noop = all(
+            filter_ is None
+            for filter_ in (
+                include_names,
+                include_types,
+                include_tags,
+                exclude_names,
+                exclude_types,
+                exclude_tags,
+            )
+        )
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
         except RuntimeError:
             loop = asyncio.new_event_loop()
         memory_stream = _MemoryStream[StreamEvent](loop)
@@ -166,7 +184,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
 
     def _send(self, event: StreamEvent, event_type: str) -> None:
         """Send an event to the stream."""
-        if self.root_event_filter.include_event(event, event_type):
+        if self._filter_is_noop or self.root_event_filter.include_event(
+            event, event_type
+        ):
             self.send_stream.send_nowait(event)
 
     def __aiter__(self) -> AsyncIterator[Any]:
@@ -209,7 +229,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             # if we are the first to tap, issue stream events
             event: StandardStreamEvent = {
                 "event": f"on_{run_info['run_type']}_stream",
-                "run_id": str(run_id),
+                "run_id": run_info["str_run_id"],
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
@@ -259,7 +279,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             # if we are the first to tap, issue stream events
             event: StandardStreamEvent = {
                 "event": f"on_{run_info['run_type']}_stream",
-                "run_id": str(run_id),
+                "run_id": run_info["str_run_id"],
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
@@ -292,13 +312,14 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_: str,
         run_type: str,
         **kwargs: Any,
-    ) -> None:
-        """Update the run info."""
+    ) -> RunInfo:
+        """Update the run info and return it."""
         info: RunInfo = {
             "tags": tags or [],
             "metadata": metadata or {},
             "name": name_,
             "run_type": run_type,
+            "str_run_id": str(run_id),
             "parent_run_id": parent_run_id,
         }
 
@@ -314,6 +335,23 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
 
         self.run_map[run_id] = info
         self.parent_map[run_id] = parent_run_id
+        return info
+
+    def _send_run_start(self, run_id: UUID, info: RunInfo, data: EventData) -> None:
+        """Send the start event of a run from its freshly written run info."""
+        run_type = info["run_type"]
+        self._send(
+            {
+                "event": f"on_{run_type}_start",
+                "data": data,
+                "name": info["name"],
+                "tags": info["tags"],
+                "run_id": info["str_run_id"],
+                "metadata": info["metadata"],
+                "parent_ids": self._get_parent_ids(run_id),
+            },
+            run_type,
+        )
 
     @override
     async def on_chat_model_start(
@@ -332,7 +370,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "chat_model"
 
-        self._write_run_start_info(
+        info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -342,20 +380,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             inputs={"messages": messages},
         )
 
-        self._send(
-            {
-                "event": "on_chat_model_start",
-                "data": {
-                    "input": {"messages": messages},
-                },
-                "name": name_,
-                "tags": tags or [],
-                "run_id": str(run_id),
-                "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type,
-        )
+        self._send_run_start(run_id, info, {"input": {"messages": messages}})
 
     @override
     async def on_llm_start(
@@ -374,7 +399,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "llm"
 
-        self._write_run_start_info(
+        info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -384,22 +409,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             inputs={"prompts": prompts},
         )
 
-        self._send(
-            {
-                "event": "on_llm_start",
-                "data": {
-                    "input": {
-                        "prompts": prompts,
-                    }
-                },
-                "name": name_,
-                "tags": tags or [],
-                "run_id": str(run_id),
-                "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type,
-        )
+        self._send_run_start(run_id, info, {"input": {"prompts": prompts}})
 
     @override
     async def on_custom_event(
@@ -444,46 +454,45 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             ValueError: If the run type is not `llm` or `chat_model`.
             AssertionError: If the run ID is not found in the run map.
         """
-        run_info = self.run_map.get(run_id)
-        chunk_: GenerationChunk | BaseMessageChunk
-
-        if run_info is None:
+        try:
+            run_info = self.run_map[run_id]
+        except KeyError:
             msg = f"Run ID {run_id} not found in run map."
-            raise AssertionError(msg)
+            raise AssertionError(msg) from None
         if self.is_tapped.get(run_id):
             return
-        if run_info["run_type"] == "chat_model":
-            event = "on_chat_model_stream"
-
+        chunk_: GenerationChunk | BaseMessageChunk
+        run_type = run_info["run_type"]
+        if run_type == "chat_model":
             if chunk is None:
                 chunk_ = AIMessageChunk(content=token)
             else:
                 chunk_ = cast("ChatGenerationChunk", chunk).message
 
-        elif run_info["run_type"] == "llm":
-            event = "on_llm_stream"
+        elif run_type == "llm":
             if chunk is None:
                 chunk_ = GenerationChunk(text=token)
             else:
                 chunk_ = cast("GenerationChunk", chunk)
         else:
-            msg = f"Unexpected run type: {run_info['run_type']}"
+            msg = f"Unexpected run type: {run_type}"
             raise ValueError(msg)
 
-        self._send(
-            {
-                "event": event,
-                "data": {
-                    "chunk": chunk_,
-                },
-                "run_id": str(run_id),
+        # The invariant part of the event is built once per run rather than on
+        # every token.
+        stream_event = run_info.get("stream_event")
+        if stream_event is None:
+            stream_event = run_info["stream_event"] = {
+                "event": f"on_{run_type}_stream",
+                "data": {},
+                "run_id": run_info["str_run_id"],
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
                 "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_info["run_type"],
-        )
+            }
+
+        self._send({**stream_event, "data": {"chunk": chunk_}}, run_type)
 
     @override
     async def on_llm_end(
@@ -537,7 +546,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             {
                 "event": event,
                 "data": {"output": output, "input": inputs_},
-                "run_id": str(run_id),
+                "run_id": run_info["str_run_id"],
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
@@ -571,7 +580,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             data["input"] = inputs
             kwargs["inputs"] = inputs
 
-        self._write_run_start_info(
+        info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -581,18 +590,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             **kwargs,
         )
 
-        self._send(
-            {
-                "event": f"on_{run_type_}_start",
-                "data": data,
-                "name": name_,
-                "tags": tags or [],
-                "run_id": str(run_id),
-                "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type_,
-        )
+        self._send_run_start(run_id, info, data)
 
     @override
     async def on_chain_end(
@@ -620,7 +618,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             {
                 "event": event,
                 "data": data,
-                "run_id": str(run_id),
+                "run_id": run_info["str_run_id"],
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
@@ -668,7 +666,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         """Start a trace for a tool run."""
         name_ = _assign_name(name, serialized)
 
-        self._write_run_start_info(
+        info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -679,20 +677,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             tool_call_id=kwargs.get("tool_call_id"),
         )
 
-        self._send(
-            {
-                "event": "on_tool_start",
-                "data": {
-                    "input": inputs or {},
-                },
-                "name": name_,
-                "tags": tags or [],
-                "run_id": str(run_id),
-                "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            "tool",
-        )
+        self._send_run_start(run_id, info, {"input": inputs or {}})
 
     @override
     async def on_tool_error(
@@ -719,7 +704,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                 "input": inputs,
                 "tool_call_id": tool_call_id,
             },
-            "run_id": str(run_id),
+            "run_id": run_info["str_run_id"],
             "name": run_info["name"],
             "tags": run_info["tags"],
             "metadata": run_info["metadata"],
@@ -739,7 +724,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                     "output": output,
                     "input": inputs,
                 },
-                "run_id": str(run_id),
+                "run_id": run_info["str_run_id"],
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
@@ -765,7 +750,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "retriever"
 
-        self._write_run_start_info(
+        info = self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -775,22 +760,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             inputs={"query": query},
         )
 
-        self._send(
-            {
-                "event": "on_retriever_start",
-                "data": {
-                    "input": {
-                        "query": query,
-                    }
-                },
-                "name": name_,
-                "tags": tags or [],
-                "run_id": str(run_id),
-                "metadata": metadata or {},
-                "parent_ids": self._get_parent_ids(run_id),
-            },
-            run_type,
-        )
+        self._send_run_start(run_id, info, {"input": {"query": query}})
 
     @override
     async def on_retriever_end(
@@ -806,7 +776,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
                     "output": documents,
                     "input": run_info.get("inputs"),
                 },
-                "run_id": str(run_id),
+                "run_id": run_info["str_run_id"],
                 "name": run_info["name"],
                 "tags": run_info["tags"],
                 "metadata": run_info["metadata"],
@@ -9,7 +9,9 @@ code.
 """
 
 import asyncio
+import threading
 from asyncio import AbstractEventLoop, Queue
+from collections import deque
 from collections.abc import AsyncIterator
 from typing import Generic, TypeVar
 
@@ -34,6 +36,46 @@ class _SendStream(Generic[T]):
         self._reader_loop = reader_loop
         self._queue = queue
         self._done = done
+        # Items waiting to be moved onto the queue by the reader loop. Only one
+        # flush is scheduled at a time, so a burst of sends costs a single loop
+        # wakeup instead of one per item. Writers may live on several threads, so
+        # the pending items and the scheduled flag are guarded by a lock.
+        self._lock = threading.Lock()
+        self._pending: deque = deque()
+        self._flush_scheduled = False
+
+    def _flush(self) -> None:
+        # Runs on the reader loop; drains everything sent since it was scheduled.
+        with self._lock:
+            pending = self._pending
+            self._pending = deque()
+            self._flush_scheduled = False
+        put_nowait = self._queue.put_nowait
+        for item in pending:
+            put_nowait(item)
+
+    def _put(self, item: object) -> None:
+        with self._lock:
+            if self._reader_loop.is_closed():
+                # Nothing will ever read these, including items waiting on a
+                # flush that was scheduled before the loop closed, so drop them.
+                self._pending.clear()
+                return
+            self._pending.append(item)
+            if self._flush_scheduled:
+                # The scheduled flush will pick this item up.
+                return
+            self._flush_scheduled = True
+        try:
+            self._reader_loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            with self._lock:
+                self._flush_scheduled = False
+                if self._reader_loop.is_closed():
+                    # Nothing will ever read these, so drop them.
+                    self._pending.clear()
+                    return
+            raise  # Raise the exception if the loop is not closed
 
     async def send(self, item: T) -> None:
         """Schedule the item to be written to the queue using the original loop.
@@ -57,11 +99,7 @@ class _SendStream(Generic[T]):
             RuntimeError: If the event loop is already closed when trying to write to
                 the queue.
         """
-        try:
-            self._reader_loop.call_soon_threadsafe(self._queue.put_nowait, item)
-        except RuntimeError:
-            if not self._reader_loop.is_closed():
-                raise  # Raise the exception if the loop is not closed
+        self._put(item)
 
     async def aclose(self) -> None:
         """Async schedule the done object write the queue using the original loop."""
@@ -76,11 +114,7 @@ class _SendStream(Generic[T]):
             RuntimeError: If the event loop is already closed when trying to write to
                 the queue.
         """
-        try:
-            self._reader_loop.call_soon_threadsafe(self._queue.put_nowait, self._done)
-        except RuntimeError:
-            if not self._reader_loop.is_closed():
-                raise  # Raise the exception if the loop is not closed
+        self._put(self._done)
 
 
 class _ReceiveStream(Generic[T]):
@@ -95,8 +129,10 @@ class _ReceiveStream(Generic[T]):
         self._is_closed = False
 
     async def __aiter__(self) -> AsyncIterator[T]:
+        queue = self._queue
         while True:
-            item = await self._queue.get()
+            # Drain buffered items directly and only await when the queue is empty.
+            item = queue.get_nowait() if queue.qsize() else await queue.get()
             if item is self._done:
                 self._is_closed = True
                 break
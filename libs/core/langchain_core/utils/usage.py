@@ -2,6 +2,8 @@
 
 from collections.abc import Callable
 
+_MISSING = object()
+
 
 def _dict_int_op(
     left: dict,
@@ -14,8 +16,8 @@ def _dict_int_op(
 ) -> dict:
     """Apply an integer operation to corresponding values in two dictionaries.
 
-    Recursively combines two dictionaries by applying the given operation to integer
-    values at matching keys.
+    Combines two dictionaries by applying the given operation to integer values at
+    matching keys.
 
     Supports nested dictionaries.
 
@@ -24,8 +26,8 @@ def _dict_int_op(
         right: Second dictionary to combine.
         op: Binary operation function to apply to integer values.
         default: Default value to use when a key is missing from a dictionary.
-        depth: Current recursion depth (used internally).
-        max_depth: Maximum recursion depth (to prevent infinite loops).
+        depth: Depth of `left` and `right` within the outermost dictionaries.
+        max_depth: Maximum nesting depth (to prevent infinite loops).
 
     Returns:
         A new dictionary with combined values.
@@ -33,28 +35,37 @@ def _dict_int_op(
     Raises:
         ValueError: If `max_depth` is exceeded or if value types are not supported.
     """
-    if depth >= max_depth:
-        msg = f"{max_depth=} exceeded, unable to combine dicts."
-        raise ValueError(msg)
     combined: dict = {}
-    for k in set(left).union(right):
-        if isinstance(left.get(k, default), int) and isinstance(
-            right.get(k, default), int
-        ):
-            combined[k] = op(left.get(k, default), right.get(k, default))
-        elif isinstance(left.get(k, {}), dict) and isinstance(right.get(k, {}), dict):
-            combined[k] = _dict_int_op(
-                left.get(k, {}),
-                right.get(k, {}),
-                op,
-                default=default,
-                depth=depth + 1,
-                max_depth=max_depth,
-            )
-        else:
-            types = [type(d[k]) for d in (left, right) if k in d]
-            msg = (
-                f"Unknown value types: {types}. Only dict and int values are supported."
-            )
-            raise ValueError(msg)  # noqa: TRY004
+    # Nested dicts are combined from an explicit worklist rather than through
+    # recursive calls, each entry holding the pair to combine, the dict to write
+    # the result into and its depth.
+    pending: list[tuple[dict, dict, dict, int]] = [(left, right, combined, depth)]
+    while pending:
+        left_, right_, dest, level = pending.pop()
+        if level >= max_depth:
+            msg = f"{max_depth=} exceeded, unable to combine dicts."
+            raise ValueError(msg)
+        # Dicts of the same shape, the usual case, need no key union at all.
+        keys = left_ if left_.keys() == right_.keys() else left_.keys() | right_.keys()
+        for k in keys:
+            left_val = left_.get(k, _MISSING)
+            right_val = right_.get(k, _MISSING)
+            # A key missing on one side takes the shape of the other side's value.
+            if left_val is _MISSING:
+                left_val = {} if isinstance(right_val, dict) else default
+            elif right_val is _MISSING:
+                right_val = {} if isinstance(left_val, dict) else default
+            if isinstance(left_val, int) and isinstance(right_val, int):
+                dest[k] = op(left_val, right_val)
+            elif isinstance(left_val, dict) and isinstance(right_val, dict):
+                nested: dict = {}
+                dest[k] = nested
+                pending.append((left_val, right_val, nested, level + 1))
+            else:
+                types = [type(d[k]) for d in (left_, right_) if k in d]
+                msg = (
+                    f"Unknown value types: {types}. "
+                    "Only dict and int values are supported."
+                )
+                raise ValueError(msg)  # noqa: TRY004
     return combined
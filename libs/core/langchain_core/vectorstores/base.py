@@ -39,6 +39,8 @@ logger = logging.getLogger(__name__)
 
 VST = TypeVar("VST", bound="VectorStore")
 
+_SQRT_2 = math.sqrt(2)
+
 
 class VectorStore(ABC):
     """Interface for vector store."""
@@ -385,7 +387,7 @@ class VectorStore(ABC):
         # This function converts the Euclidean norm of normalized embeddings
         # (0 is most similar, sqrt(2) most dissimilar)
         # to a similarity function (0 to 1)
-        return 1.0 - distance / math.sqrt(2)
+        return 1.0 - distance / _SQRT_2
 
     @staticmethod
     def _cosine_relevance_score_fn(distance: float) -> float:
@@ -898,8 +900,8 @@ class VectorStore(ABC):
     def _get_retriever_tags(self) -> list[str]:
         """Get tags for retriever."""
         tags = [self.__class__.__name__]
-        if self.embeddings:
-            tags.append(self.embeddings.__class__.__name__)
+        if embeddings := self.embeddings:
+            tags.append(embeddings.__class__.__name__)
         return tags
 
     def as_retriever(self, **kwargs: Any) -> VectorStoreRetriever:
@@ -1023,10 +1025,8 @@ class VectorStoreRetriever(BaseRetriever):
 
         ls_params["ls_vector_store_provider"] = self.vectorstore.__class__.__name__
 
-        if self.vectorstore.embeddings:
-            ls_params["ls_embedding_provider"] = (
-                self.vectorstore.embeddings.__class__.__name__
-            )
+        if embeddings := self.vectorstore.embeddings:
+            ls_params["ls_embedding_provider"] = embeddings.__class__.__name__
         elif hasattr(self.vectorstore, "embedding") and isinstance(
             self.vectorstore.embedding, Embeddings
         ):
@@ -313,8 +313,21 @@ class InMemoryVectorStore(VectorStore):
 
         similarity = cosine_similarity([embedding], [doc["vector"] for doc in docs])[0]
 
-        # Get the indices ordered by similarity score
-        top_k_idx = similarity.argsort()[::-1][:k]
+        # Get the indices ordered by similarity score, breaking ties by descending
+        # index. When only a few of many documents are requested, select them
+        # first so just those get sorted; every document tied with the k-th score
+        # is kept so the tie-break decides which of them make the cut.
+        candidates = None
+        if 0 < k < len(similarity):
+            kth_score = similarity[np.argpartition(similarity, -k)[-k:]].min()
+            # NaN scores rank above all others, as in a full sort, but compare
+            # false against everything, so sort everything when one is selected.
+            if not np.isnan(kth_score):
+                candidates = np.flatnonzero(similarity >= kth_score)
+        if candidates is None:
+            candidates = np.arange(len(similarity))
+        order = np.lexsort((candidates, similarity[candidates]))[::-1]
+        top_k_idx = candidates[order][:k]
 
         return [
             (
@@ -134,24 +134,29 @@ def maximal_marginal_relevance(
         return []
     if query_embedding.ndim == 1:
         query_embedding = np.expand_dims(query_embedding, axis=0)
-    similarity_to_query = _cosine_similarity(query_embedding, embedding_list)[0]
+    embeddings = np.asarray(embedding_list)
+    similarity_to_query = _cosine_similarity(query_embedding, embeddings)[0]
+    norms = np.linalg.norm(embeddings, axis=1)
+
+    def _similarity_to(idx: int) -> np.ndarray:
+        # Cosine similarity of every candidate to candidate `idx`; undefined
+        # values (e.g. zero vectors) count as 0 like in `_cosine_similarity`.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity: np.ndarray = embeddings @ embeddings[idx] / (norms * norms[idx])
+        similarity[~np.isfinite(similarity)] = 0.0
+        return similarity
+
     most_similar = int(np.argmax(similarity_to_query))
     idxs = [most_similar]
-    selected = np.array([embedding_list[most_similar]])
-    while len(idxs) < min(k, len(embedding_list)):
-        best_score = -np.inf
-        idx_to_add = -1
-        similarity_to_selected = _cosine_similarity(embedding_list, selected)
-        for i, query_score in enumerate(similarity_to_query):
-            if i in idxs:
-                continue
-            redundant_score = max(similarity_to_selected[i])
-            equation_score = (
-                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
-            )
-            if equation_score > best_score:
-                best_score = equation_score
-                idx_to_add = i
+    # Highest similarity of each candidate to any selected embedding, folded in
+    # one selection at a time.
+    redundant_scores = np.full(len(embeddings), -np.inf)
+    while len(idxs) < min(k, len(embeddings)):
+        redundant_scores = np.maximum(redundant_scores, _similarity_to(idxs[-1]))
+        equation_scores = (
+            lambda_mult * similarity_to_query - (1 - lambda_mult) * redundant_scores
+        )
+        equation_scores[idxs] = -np.inf
+        idx_to_add = int(np.argmax(equation_scores))
         idxs.append(idx_to_add)
-        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
     return idxs
@@ -1,5 +1,7 @@
 from typing import cast
 
+import pytest
+
 from langchain_core.load import dumpd, load
 from langchain_core.messages import AIMessage, AIMessageChunk
 from langchain_core.messages import content as types
@@ -168,6 +170,43 @@ def test_subtract_usage_with_negative_result() -> None:
     assert result == UsageMetadata(input_tokens=0, output_tokens=0, total_tokens=0)
 
 
+def test_subtract_usage_with_details() -> None:
+    usage1 = UsageMetadata(
+        input_tokens=10,
+        output_tokens=20,
+        total_tokens=30,
+        input_token_details=InputTokenDetails(audio=5),
+    )
+    usage2 = UsageMetadata(
+        input_tokens=5,
+        output_tokens=10,
+        total_tokens=15,
+        output_token_details=OutputTokenDetails(reasoning=5),
+    )
+    result = subtract_usage(usage1, usage2)
+    assert result == UsageMetadata(
+        input_tokens=5,
+        output_tokens=10,
+        total_tokens=15,
+        input_token_details=InputTokenDetails(audio=5),
+        output_token_details=OutputTokenDetails(reasoning=0),
+    )
+
+
+@pytest.mark.parametrize("value", [1.5, None])
+def test_usage_ops_reject_non_int_counts(value: float | None) -> None:
+    usage1 = cast(
+        "UsageMetadata",
+        {"input_tokens": value, "output_tokens": 1, "total_tokens": 1},
+    )
+    usage2 = UsageMetadata(input_tokens=1, output_tokens=1, total_tokens=2)
+    for op in (add_usage, subtract_usage):
+        with pytest.raises(ValueError, match="Unknown value types"):
+            op(usage1, usage2)
+        with pytest.raises(ValueError, match="Unknown value types"):
+            op(usage2, usage1)
+
+
 def test_add_ai_message_chunks_usage() -> None:
     chunks = [
         AIMessageChunk(content="", usage_metadata=None),
@@ -138,3 +138,62 @@ def test_image_prompt_template_deserialization_rejects_attribute_access() -> Non
 
     with pytest.raises(ValueError, match="Variable names cannot contain attribute"):
         loads(payload)
+
+
+async def test_image_prompt_template_aformat() -> None:
+    prompt = ImagePromptTemplate(
+        input_variables=["image_id"],
+        template={"url": "https://example.com/{image_id}.png", "detail": "high"},
+    )
+    expected = {"url": "https://example.com/cat.png", "detail": "high"}
+    assert await prompt.aformat(image_id="cat") == expected
+    assert prompt.format(image_id="cat") == expected
+
+
+def test_image_prompt_template_static_template() -> None:
+    prompt = ImagePromptTemplate(
+        template={"url": "https://example.com/cat.png", "detail": "low"},
+    )
+    expected = {"url": "https://example.com/cat.png", "detail": "low"}
+    assert prompt.format() == expected
+    assert prompt.format(unused="value") == expected
+    partial = prompt.partial(foo="bar")
+    assert isinstance(partial, ImagePromptTemplate)
+    assert partial.format() == expected
+
+
+def test_image_prompt_template_format_uses_current_template() -> None:
+    prompt = ImagePromptTemplate(
+        input_variables=["image_id"],
+        template={"url": "https://example.com/{image_id}.png"},
+    )
+    assert prompt.format(image_id="cat") == {"url": "https://example.com/cat.png"}
+    copied = prompt.model_copy(
+        update={"template": {"url": "https://example.org/{image_id}.jpg"}}
+    )
+    assert copied.format(image_id="cat") == {"url": "https://example.org/cat.jpg"}
+    prompt.template = {"url": "https://example.net/static.png", "detail": "high"}
+    assert prompt.format(image_id="cat") == {
+        "url": "https://example.net/static.png",
+        "detail": "high",
+    }
+
+
+def test_image_prompt_template_rejects_reserved_input_variables() -> None:
+    with pytest.raises(ValueError, match="cannot contain"):
+        ImagePromptTemplate(
+            input_variables=["url"],
+            template={"url": "https://example.com/cat.png"},
+        )
+
+
+def test_image_prompt_template_format_kwargs_override_template() -> None:
+    prompt = ImagePromptTemplate(
+        template={"url": "https://example.com/cat.png", "detail": "low"},
+    )
+    assert prompt.format(url="https://example.com/dog.png", detail="") == {
+        "url": "https://example.com/dog.png",
+        "detail": "low",
+    }
+    with pytest.raises(ValueError, match="'path' has been removed"):
+        prompt.format(path="cat.png")
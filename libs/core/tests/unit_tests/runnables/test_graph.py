@@ -1,6 +1,10 @@
+import base64
+import json
+import zlib
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
 from packaging import version
 from pydantic import BaseModel
 from syrupy.assertion import SnapshotAssertion
@@ -16,14 +20,21 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.base import Runnable
 from langchain_core.runnables.graph import Edge, Graph, MermaidDrawMethod, Node
 from langchain_core.runnables.graph_mermaid import (
+    _API_IMAGE_CACHE,
     _render_mermaid_using_api,
     _to_safe_id,
+    draw_mermaid,
     draw_mermaid_png,
 )
 from langchain_core.utils.pydantic import PYDANTIC_VERSION
 from tests.unit_tests.pydantic_utils import _normalize_schema
 
 
+@pytest.fixture(autouse=True)
+def _clear_mermaid_api_image_cache() -> None:
+    _API_IMAGE_CACHE.clear()
+
+
 def test_graph_single_runnable(snapshot: SnapshotAssertion) -> None:
     runnable = StrOutputParser()
     graph = StrOutputParser().get_graph()
@@ -528,6 +539,28 @@ def test_graph_mermaid_to_safe_id() -> None:
     assert _to_safe_id("foo-bar") == "foo-bar"
     assert _to_safe_id("foo_1") == "foo_1"
     assert _to_safe_id("#foo*&!") == "\\23foo\\2a\\26\\21"
+    assert _to_safe_id("foo bar") == "foo\\20bar"
+    assert _to_safe_id("héllo✓") == "h\\e9llo\\2713"
+
+
+def test_graph_mermaid_wrap_edge_labels() -> None:
+    nodes = {
+        "a": Node(id="a", name="a", data=None, metadata=None),
+        "b": Node(id="b", name="b", data=None, metadata=None),
+    }
+    edges = [
+        Edge(source="a", target="b", data="one two three", conditional=False),
+        Edge(source="b", target="a", data="x y z w", conditional=True),
+    ]
+    mermaid = draw_mermaid(nodes, edges, with_styles=False, wrap_label_n_words=2)
+    assert mermaid == (
+        "graph TD;\n"
+        "\ta -- &nbsp;one two&nbsp<br>&nbspthree&nbsp; --> b;\n"
+        "\tb -. &nbsp;x y&nbsp<br>&nbspz w&nbsp; .-> a;\n"
+    )
+    mermaid = draw_mermaid(nodes, edges, with_styles=False)
+    assert "&nbsp;one two three&nbsp;" in mermaid
+    assert "&nbsp;x y z w&nbsp;" in mermaid
 
 
 def test_graph_mermaid_duplicate_nodes(snapshot: SnapshotAssertion) -> None:
@@ -698,6 +731,46 @@ def test_mermaid_bgcolor_hex_not_encoded() -> None:
         assert "%23ffffff" in url  # '#' encoded as '%23'
 
 
+def test_mermaid_api_image_cache() -> None:
+    """Test that identical renders reuse the image fetched from the API."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b"fake image data"
+
+    with patch("requests.get", return_value=mock_response) as mock_get:
+        first = _render_mermaid_using_api("graph TD;\n    A --> B;")
+        second = _render_mermaid_using_api("graph TD;\n    A --> B;")
+        assert first == second == b"fake image data"
+        assert mock_get.call_count == 1
+
+        _render_mermaid_using_api("graph TD;\n    A --> B;", background_color="red")
+        assert mock_get.call_count == 2
+
+
+def test_mermaid_api_compresses_large_graphs() -> None:
+    """Test that large graphs are sent in the compressed pako format."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b"fake image data"
+    small_syntax = "graph TD;\n    A --> B;"
+    large_syntax = "graph TD;\n" + "".join(
+        f"    node_{i} --> node_{i + 1};\n" for i in range(200)
+    )
+
+    with patch("requests.get", return_value=mock_response) as mock_get:
+        _render_mermaid_using_api(small_syntax)
+        url = mock_get.call_args[0][0]
+        assert "/img/pako:" not in url
+
+        _render_mermaid_using_api(large_syntax)
+        url = mock_get.call_args[0][0]
+        encoded = url.split("/img/pako:", 1)[1].split("?", 1)[0]
+        padded = encoded + "=" * (-len(encoded) % 4)
+        state = json.loads(zlib.decompress(base64.urlsafe_b64decode(padded)))
+        assert state["code"] == large_syntax
+        assert len(url) < len(base64.b64encode(large_syntax.encode()))
+
+
 def test_graph_mermaid_special_chars(snapshot: SnapshotAssertion) -> None:
     graph = Graph(
         nodes={
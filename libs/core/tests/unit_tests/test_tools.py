@@ -29,7 +29,9 @@ from typing_extensions import TypedDict, override
 
 from langchain_core import tools
 from langchain_core.callbacks import (
+    AsyncCallbackManager,
     AsyncCallbackManagerForToolRun,
+    CallbackManager,
     CallbackManagerForToolRun,
 )
 from langchain_core.callbacks.manager import (
@@ -59,6 +61,7 @@ from langchain_core.tools.base import (
     SchemaAnnotationError,
     _DirectlyInjectedToolArg,
     _format_output,
+    _get_runnable_config_param,
     _is_message_content_block,
     _is_message_content_type,
     get_all_basemodel_annotations,
@@ -1165,6 +1168,76 @@ def test_tool_pass_config(tool: BaseTool) -> None:
     assert tool_call["args"] == {"bar": "baz"}
 
 
+def test_get_runnable_config_param() -> None:
+    class Foo:
+        def run(self, bar: str, bar_config: RunnableConfig) -> str:
+            return bar
+
+        def run_no_config(self, bar: str) -> str:
+            return bar
+
+    for _ in range(2):
+        assert _get_runnable_config_param(Foo().run) == "bar_config"
+        assert _get_runnable_config_param(Foo().run_no_config) is None
+        assert _get_runnable_config_param(partial(Foo().run, "baz")) == "bar_config"
+
+    def uses_forward_ref(bar: "_LaterDefined", bar_config: RunnableConfig) -> None:  # type: ignore[name-defined] # noqa: F821
+        pass
+
+    assert _get_runnable_config_param(uses_forward_ref) is None
+    uses_forward_ref.__annotations__["bar"] = str
+    assert _get_runnable_config_param(uses_forward_ref) == "bar_config"
+
+
+async def test_structured_tool_pass_callbacks() -> None:
+    received: list[Any] = []
+
+    def foo(bar: str, callbacks: Any = None) -> str:
+        """The foo."""
+        received.append(callbacks)
+        return bar
+
+    async def afoo(bar: str, callbacks: Any = None) -> str:
+        """The foo."""
+        received.append(callbacks)
+        return bar
+
+    tool = StructuredTool.from_function(func=foo, coroutine=afoo)
+    config: RunnableConfig = {"callbacks": [FakeCallbackHandler()]}
+    for _ in range(2):
+        assert tool.invoke({"bar": "baz"}, config) == "baz"
+        assert await tool.ainvoke({"bar": "baz"}, config) == "baz"
+    assert [type(cb) for cb in received] == [
+        CallbackManager,
+        AsyncCallbackManager,
+    ] * 2
+
+
+def test_structured_tool_reassigned_func() -> None:
+    def foo(bar: str, config: RunnableConfig) -> str:
+        """The foo."""
+        return bar
+
+    def foo2(bar: str) -> str:
+        """The foo."""
+        return bar * 2
+
+    def foo3(bar: str, callbacks: Any = None) -> str:
+        """The foo."""
+        assert isinstance(callbacks, CallbackManager)
+        return bar * 3
+
+    tool = StructuredTool.from_function(func=foo)
+    assert tool.invoke({"bar": "baz"}) == "baz"
+
+    copied = tool.model_copy(update={"func": foo2})
+    assert copied.invoke({"bar": "baz"}) == "bazbaz"
+
+    tool.func = foo3
+    config: RunnableConfig = {"callbacks": [FakeCallbackHandler()]}
+    assert tool.invoke({"bar": "baz"}, config) == "bazbazbaz"
+
+
 class FooBaseNonPickleable(FooBase):
     @override
     def _run(self, bar: Any, bar_config: RunnableConfig, **kwargs: Any) -> Any:
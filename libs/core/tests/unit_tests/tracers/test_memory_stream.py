@@ -1,9 +1,11 @@
 import asyncio
 import math
+import threading
 import time
+from collections import deque
 from collections.abc import AsyncIterator
 
-from langchain_core.tracers.memory_stream import _MemoryStream
+from langchain_core.tracers.memory_stream import _MemoryStream, _ReceiveStream
 
 
 async def test_same_event_loop() -> None:
@@ -128,6 +130,8 @@ def test_send_to_closed_stream() -> None:
     event_loop.close()
     writer.close()
     writer.send_nowait("hello")
+    # Items sent after the loop closed are dropped rather than buffered.
+    assert not writer._pending
 
 
 async def test_closed_stream() -> None:
@@ -138,3 +142,83 @@ async def test_closed_stream() -> None:
     await writer.aclose()
 
     assert [chunk async for chunk in reader] == []
+
+
+async def test_burst_of_sends_preserves_order() -> None:
+    reader_loop = asyncio.get_event_loop()
+    channel = _MemoryStream[int](reader_loop)
+    writer = channel.get_send_stream()
+    reader = channel.get_receive_stream()
+
+    for i in range(100):
+        writer.send_nowait(i)
+    writer.close()
+
+    assert [item async for item in reader] == list(range(100))
+
+
+async def test_sends_from_another_thread_preserve_order() -> None:
+    reader_loop = asyncio.get_event_loop()
+    channel = _MemoryStream[int](reader_loop)
+    writer = channel.get_send_stream()
+    reader = channel.get_receive_stream()
+
+    def produce() -> None:
+        for i in range(1000):
+            writer.send_nowait(i)
+        writer.close()
+
+    task = asyncio.create_task(asyncio.to_thread(produce))
+    items = [item async for item in reader]
+    await task
+
+    assert items == list(range(1000))
+
+
+class _YieldingDeque(deque):
+    """Deque that lets other threads run right after each append."""
+
+    def append(self, item: object) -> None:
+        super().append(item)
+        time.sleep(0.001)
+
+
+async def test_concurrent_senders_from_several_threads() -> None:
+    reader_loop = asyncio.get_event_loop()
+    channel = _MemoryStream[tuple[int, int]](reader_loop)
+    writer = channel.get_send_stream()
+    reader = channel.get_receive_stream()
+    # Give every sender a chance to append before any of them decides whether a
+    # flush still has to be scheduled.
+    writer._pending = _YieldingDeque()
+    n_threads, n_rounds = 3, 200
+    barrier = threading.Barrier(n_threads)
+
+    def produce(thread_id: int) -> None:
+        for i in range(n_rounds):
+            # Release all senders at once so they race on an empty buffer.
+            barrier.wait()
+            writer.send_nowait((thread_id, i))
+
+    def produce_all() -> None:
+        threads = [
+            threading.Thread(target=produce, args=(thread_id,))
+            for thread_id in range(n_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+    task = asyncio.create_task(asyncio.to_thread(produce_all))
+    items = await asyncio.wait_for(_collect(reader), timeout=10)
+    await task
+
+    assert len(items) == n_threads * n_rounds
+    for thread_id in range(n_threads):
+        assert [i for t, i in items if t == thread_id] == list(range(n_rounds))
+
+
+async def _collect(reader: _ReceiveStream[tuple[int, int]]) -> list[tuple[int, int]]:
+    return [item async for item in reader]
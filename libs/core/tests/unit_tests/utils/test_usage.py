@@ -26,6 +26,13 @@ def test_dict_int_op_nested() -> None:
     assert result == {"a": 3, "b": {"c": 3, "d": 3, "e": 4}}
 
 
+def test_dict_int_op_key_missing_on_one_side() -> None:
+    left = {"a": 1, "b": {"c": 2}}
+    right = {"d": {"e": 3}, "f": 4}
+    result = _dict_int_op(left, right, operator.sub)
+    assert result == {"a": 1, "b": {"c": 2}, "d": {"e": -3}, "f": -4}
+
+
 def test_dict_int_op_max_depth_exceeded() -> None:
     left = {"a": {"b": {"c": 1}}}
     right = {"a": {"b": {"c": 2}}}
@@ -1,12 +1,15 @@
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
+import numpy as np
 import pytest
 from langchain_tests.integration_tests.vectorstores import VectorStoreIntegrationTests
 
 from langchain_core.documents import Document
 from langchain_core.embeddings.fake import DeterministicFakeEmbedding
-from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import InMemoryVectorStore, in_memory
+from langchain_core.vectorstores.utils import _cosine_similarity
 from tests.unit_tests.stubs import _any_id_document
 
 
@@ -47,6 +50,51 @@ async def test_inmemory_similarity_search_with_score() -> None:
     assert output[0][1] > output[1][1]
 
 
+def test_inmemory_similarity_search_top_k_order() -> None:
+    """Test that a partial top-k selection matches a full ranking."""
+    texts = [f"text {i}" for i in range(50)]
+    store = InMemoryVectorStore.from_texts(texts, DeterministicFakeEmbedding(size=8))
+
+    ranked = store.similarity_search_with_score("query", k=len(texts))
+    top = store.similarity_search_with_score("query", k=5)
+
+    assert top == ranked[:5]
+    assert [score for _, score in top] == sorted(
+        (score for _, score in top), reverse=True
+    )
+
+
+def test_inmemory_similarity_search_top_k_order_with_ties(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that tied scores are ordered the same for any k."""
+    texts = [f"text {i % 4}" for i in range(40)]
+    ids = [str(i) for i in range(len(texts))]
+    store = InMemoryVectorStore.from_texts(
+        texts, DeterministicFakeEmbedding(size=8), ids=ids
+    )
+
+    ranked = [doc.id for doc in store.similarity_search("text 1", k=len(texts))]
+    assert ranked[:10] == [str(i) for i in range(37, 0, -4)]
+    for k in range(1, len(texts) + 1):
+        top = store.similarity_search("text 1", k=k)
+        assert [doc.id for doc in top] == ranked[:k]
+
+    # A NaN score (e.g. from a stored vector holding NaN) ranks first, as in a
+    # full sort, and never shortens the results.
+    def _cosine_similarity_with_nan(x: Any, y: Any) -> np.ndarray:
+        similarity = _cosine_similarity(x, y)
+        similarity[0][5] = np.nan
+        return similarity
+
+    monkeypatch.setattr(in_memory, "cosine_similarity", _cosine_similarity_with_nan)
+    ranked = [doc.id for doc in store.similarity_search("text 1", k=len(texts))]
+    assert ranked[0] == "5"
+    for k in range(1, len(texts) + 1):
+        top = store.similarity_search("text 1", k=k)
+        assert [doc.id for doc in top] == ranked[:k]
+
+
 async def test_add_by_ids() -> None:
     """Test add texts with ids."""
     vectorstore = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=6))
@@ -7,7 +7,10 @@ import pytest
 pytest.importorskip("numpy")
 import numpy as np
 
-from langchain_core.vectorstores.utils import _cosine_similarity
+from langchain_core.vectorstores.utils import (
+    _cosine_similarity,
+    maximal_marginal_relevance,
+)
 
 
 class TestCosineSimilarity:
@@ -162,3 +165,49 @@ class TestCosineSimilarity:
             ]
         )
         np.testing.assert_array_almost_equal(result, expected)
+
+
+class TestMaximalMarginalRelevance:
+    """Tests for maximal_marginal_relevance function."""
+
+    def test_prefers_diverse_results(self) -> None:
+        """Test that a near-duplicate of a selected embedding is skipped."""
+        query = np.array([1.0, 0.0])
+        embeddings = [[1.0, 0.0], [0.99, 0.01], [0.7, 0.7]]
+        assert maximal_marginal_relevance(query, embeddings, lambda_mult=0.25, k=2) == [
+            0,
+            2,
+        ]
+
+    def test_lambda_one_ranks_by_similarity(self) -> None:
+        """Test that `lambda_mult=1` ignores diversity."""
+        query = np.array([1.0, 0.0])
+        embeddings = [[0.0, 1.0], [1.0, 0.0], [0.99, 0.01], [0.7, 0.7]]
+        assert maximal_marginal_relevance(query, embeddings, lambda_mult=1, k=4) == [
+            1,
+            2,
+            3,
+            0,
+        ]
+
+    def test_k_larger_than_candidates(self) -> None:
+        """Test that every candidate is returned once when `k` exceeds them."""
+        query = np.array([1.0, 0.0])
+        embeddings = [[1.0, 0.0], [0.0, 1.0]]
+        result = maximal_marginal_relevance(query, embeddings, k=5)
+        assert sorted(result) == [0, 1]
+
+    def test_zero_vector_candidate(self) -> None:
+        """Test that a zero-vector candidate is scored as dissimilar, not an error."""
+        query = np.array([1.0, 0.0])
+        embeddings = [[1.0, 0.0], [0.0, 0.0]]
+        assert maximal_marginal_relevance(query, embeddings, lambda_mult=0.5, k=2) == [
+            0,
+            1,
+        ]
+
+    def test_empty(self) -> None:
+        """Test with no candidates or `k=0`."""
+        query = np.array([1.0, 0.0])
+        assert maximal_marginal_relevance(query, [], k=4) == []
+        assert maximal_marginal_relevance(query, [[1.0, 0.0]], k=0) == []
@@ -83,8 +83,14 @@ EXPECT_ALL = [
     "VolcEngineMaasLLM",
     "WatsonxLLM",
 ]
+_EXPECTED = frozenset(EXPECT_ALL)
 
 
 def test_all_imports() -> None:
     """Simple test to make sure all things can be imported."""
-    assert set(llms.__all__) == set(EXPECT_ALL)
+    assert len(EXPECT_ALL) == len(_EXPECTED), "EXPECT_ALL contains duplicates"
+    actual = frozenset(llms.__all__)
+    extra = actual - _EXPECTED
+    missing = _EXPECTED - actual
+    assert not extra, f"Unexpected exports: {sorted(extra)}"
+    assert not missing, f"Missing exports: {sorted(missing)}"